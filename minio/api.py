@@ -467,7 +467,7 @@ class Minio:  # pylint: disable=too-many-public-methods
             query_params={"location": ""},
         )
 
-        element = ET.fromstring(response.data.decode())
+        element = ET.fromstring(response.data)
         if not element.text:
             region = "us-east-1"
         elif element.text == "EU":
@@ -626,7 +626,7 @@ class Minio:  # pylint: disable=too-many-public-methods
         """
 
         response = self._execute("GET")
-        result = unmarshal(ListAllMyBucketsResult, response.data.decode())
+        result = unmarshal(ListAllMyBucketsResult, response.data)
         return result.buckets
 
     def bucket_exists(self, bucket_name):
@@ -727,7 +727,7 @@ class Minio:  # pylint: disable=too-many-public-methods
         response = self._execute(
             "GET", bucket_name, query_params={"notification": ""},
         )
-        return unmarshal(NotificationConfig, response.data.decode())
+        return unmarshal(NotificationConfig, response.data)
 
     def set_bucket_notification(self, bucket_name, config):
         """
@@ -814,7 +814,7 @@ class Minio:  # pylint: disable=too-many-public-methods
                 bucket_name,
                 query_params={"encryption": ""},
             )
-            return unmarshal(SSEConfig, response.data.decode())
+            return unmarshal(SSEConfig, response.data)
         except S3Error as exc:
             if exc.code != "ServerSideEncryptionConfigurationNotFoundError":
                 raise
@@ -937,7 +937,7 @@ class Minio:  # pylint: disable=too-many-public-methods
             bucket_name,
             query_params={"versioning": ""},
         )
-        return unmarshal(VersioningConfig, response.data.decode())
+        return unmarshal(VersioningConfig, response.data)
 
     def fput_object(self, bucket_name, object_name, file_path,
                     content_type='application/octet-stream',
@@ -1152,7 +1152,7 @@ class Minio:  # pylint: disable=too-many-public-methods
             object_name=object_name,
             headers=headers,
         )
-        element = ET.fromstring(response.data.decode())
+        element = ET.fromstring(response.data)
         etag = findtext(element, "ETag")
         if etag:
             etag = etag.replace('"', "")
@@ -1211,7 +1211,7 @@ class Minio:  # pylint: disable=too-many-public-methods
             headers=headers,
             query_params={"uploads": ""},
         )
-        element = ET.fromstring(response.data.decode())
+        element = ET.fromstring(response.data)
         return findtext(element, "UploadId")
 
     def _put_object(self, bucket_name, object_name, data, headers,
@@ -1538,11 +1538,11 @@ class Minio:  # pylint: disable=too-many-public-methods
             query_params={"delete": ""},
         )
 
-        element = ET.fromstring(response.data.decode())
+        element = ET.fromstring(response.data)
         return (
             DeleteResult([], [DeleteError.fromxml(element)])
             if element.tag.endswith("Error")
-            else unmarshal(DeleteResult, response.data.decode())
+            else unmarshal(DeleteResult, response.data)
         )
 
     def remove_objects(self, bucket_name, delete_object_list,
@@ -1850,7 +1850,7 @@ class Minio:  # pylint: disable=too-many-public-methods
             response = self._execute(
                 "GET", bucket_name, query_params={"replication": ""},
             )
-            return unmarshal(ReplicationConfig, response.data.decode())
+            return unmarshal(ReplicationConfig, response.data)
         except S3Error as exc:
             if exc.code != "ReplicationConfigurationNotFoundError":
                 raise
@@ -1927,7 +1927,7 @@ class Minio:  # pylint: disable=too-many-public-methods
             response = self._execute(
                 "GET", bucket_name, query_params={"lifecycle": ""},
             )
-            return unmarshal(LifecycleConfig, response.data.decode())
+            return unmarshal(LifecycleConfig, response.data)
         except S3Error as exc:
             if exc.code != "NoSuchLifecycleConfiguration":
                 raise
@@ -1992,7 +1992,7 @@ class Minio:  # pylint: disable=too-many-public-methods
             response = self._execute(
                 "GET", bucket_name, query_params={"tagging": ""},
             )
-            tagging = unmarshal(Tagging, response.data.decode())
+            tagging = unmarshal(Tagging, response.data)
             return tagging.tags()
         except S3Error as exc:
             if exc.code != "NoSuchTagSet":
@@ -2069,7 +2069,7 @@ class Minio:  # pylint: disable=too-many-public-methods
                 object_name=object_name,
                 query_params=query_params,
             )
-            tagging = unmarshal(Tagging, response.data.decode())
+            tagging = unmarshal(Tagging, response.data)
             return tagging.tags()
         except S3Error as exc:
             if exc.code != "NoSuchTagSet":
@@ -2187,7 +2187,7 @@ class Minio:  # pylint: disable=too-many-public-methods
                 object_name=object_name,
                 query_params=query_params,
             )
-            legal_hold = unmarshal(LegalHold, response.data.decode())
+            legal_hold = unmarshal(LegalHold, response.data)
             return legal_hold.status
         except S3Error as exc:
             if exc.code != "NoSuchObjectLockConfiguration":
@@ -2221,7 +2221,7 @@ class Minio:  # pylint: disable=too-many-public-methods
         response = self._execute(
             "GET", bucket_name, query_params={"object-lock": ""},
         )
-        return unmarshal(ObjectLockConfig, response.data.decode())
+        return unmarshal(ObjectLockConfig, response.data)
 
     def set_object_lock_config(self, bucket_name, config):
         """
@@ -2273,7 +2273,7 @@ class Minio:  # pylint: disable=too-many-public-methods
                 object_name=object_name,
                 query_params=query_params,
             )
-            return unmarshal(Retention, response.data.decode())
+            return unmarshal(Retention, response.data)
         except S3Error as exc:
             if exc.code != "NoSuchObjectLockConfiguration":
                 raise
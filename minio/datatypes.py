@@ -20,16 +20,55 @@ Response of ListBuckets, ListObjects, ListObjectsV2 and ListObjectVersions API.
 
 from __future__ import absolute_import
 
+import io
 from urllib.parse import unquote
 from xml.etree import ElementTree as ET
 
 from .helpers import strptime_rfc3339
-from .xml import find, findall, findtext
+from .xml import (clarknamespace, find, findall, findqualifiedtext,
+                  findtext)
+
+_LIST_MARKERS = frozenset([
+    "IsTruncated", "NextKeyMarker", "NextVersionIdMarker",
+    "NextContinuationToken", "NextMarker",
+])
+_TRUE_VALUES = frozenset(["true", "True", "TRUE"])
+
+
+def _get_id_and_name(element, name):
+    """
+    Get ID and DisplayName of named child element like Owner or Initiator
+    with a single lookup of the child element.
+    """
+    namespace = clarknamespace(element)
+    tag = element.find(namespace + name)
+    if tag is None:
+        return None, None
+    return (
+        findqualifiedtext(tag, namespace + "ID"),
+        findqualifiedtext(tag, namespace + "DisplayName"),
+    )
+
+
+def _intern(strings, value):
+    """
+    Get shared copy of value from strings dict, adding it if missing.
+    Values like storage class and owner repeat across list entries, so
+    entries of a response then share one string object.
+    """
+    return value if value is None else strings.setdefault(value, value)
+
+
+def _fast_unquote(value):
+    """Unquote value only if it contains percent-encoded characters."""
+    return value if value is None or "%" not in value else unquote(value)
 
 
 class Bucket:
     """Bucket information."""
 
+    __slots__ = ("_name", "_creation_date")
+
     def __init__(self, name, creation_date):
         self._name = name
         self._creation_date = creation_date
@@ -48,6 +87,8 @@ class Bucket:
 class ListAllMyBucketsResult:
     """LissBuckets API result."""
 
+    __slots__ = ("_buckets",)
+
     def __init__(self, buckets):
         self._buckets = buckets
 
@@ -75,6 +116,12 @@ class ListAllMyBucketsResult:
 class Object:
     """Object information."""
 
+    __slots__ = (
+        "_bucket_name", "_object_name", "_last_modified", "_etag", "_size",
+        "_metadata", "_version_id", "_is_latest", "_storage_class",
+        "_owner_id", "_owner_name", "_content_type", "_is_delete_marker",
+    )
+
     def __init__(self,  # pylint: disable=too-many-arguments
                  bucket_name,
                  object_name,
@@ -94,6 +141,7 @@ class Object:
         self._owner_id = owner_id
         self._owner_name = owner_name
         self._content_type = content_type
+        self._is_delete_marker = size is None and version_id is not None
 
     @property
     def bucket_name(self):
@@ -113,6 +161,9 @@ class Object:
     @property
     def last_modified(self):
         """Get last modified time."""
+        if self._last_modified and isinstance(self._last_modified, str):
+            # Parsed on first access as listing callers often skip it.
+            self._last_modified = strptime_rfc3339(self._last_modified)
         return self._last_modified
 
     @property
@@ -158,7 +209,7 @@ class Object:
     @property
     def is_delete_marker(self):
         """Get whether this key is a delete marker."""
-        return self._size is None and self._version_id is not None
+        return self._is_delete_marker
 
     @property
     def content_type(self):
@@ -166,71 +217,104 @@ class Object:
         return self._content_type
 
     @classmethod
-    def fromxml(cls, element, bucket_name):
-        """Create new object with values from XML element."""
-        tag = findtext(element, "LastModified")
-        last_modified = None if tag is None else strptime_rfc3339(tag)
-
-        tag = findtext(element, "ETag")
+    def fromxml(cls, element, bucket_name, strings=None):
+        """
+        Create new object with values from XML element. Optional strings
+        dict is used to share repeated values across a response.
+        """
+        if strings is None:
+            strings = {}
+        namespace = clarknamespace(element)
+
+        tag = findqualifiedtext(element, namespace + "ETag")
         etag = None if tag is None else tag.replace('"', "")
 
-        tag = findtext(element, "Size")
+        tag = findqualifiedtext(element, namespace + "Size")
         size = None if tag is None else int(tag)
 
-        tag = find(element, "Owner")
-        owner_id, owner_name = (
-            (None, None) if tag is None
-            else (findtext(tag, "ID"), findtext(tag, "DisplayName"))
-        )
+        is_latest = findqualifiedtext(element, namespace + "IsLatest")
+        storage_class = findqualifiedtext(element, namespace + "StorageClass")
+        owner_id, owner_name = _get_id_and_name(element, "Owner")
 
-        tag = find(element, "UserMetadata") or []
+        tag = element.find(namespace + "UserMetadata") or []
         metadata = {}
         for child in tag:
-            key = child.tag.split("}")[1] if "}" in child.tag else child.tag
-            metadata[key] = child.text
+            key = child.tag.rpartition("}")[2]
+            metadata[_intern(strings, key)] = child.text
 
+        # Arguments are passed positionally in __init__() order; this runs
+        # for every listed entry and keyword matching costs more than the
+        # rest of the call.
         return cls(
             bucket_name,
-            findtext(element, "Key"),
-            last_modified=last_modified,
-            etag=etag,
-            size=size,
-            version_id=findtext(element, "VersionId"),
-            is_latest=findtext(element, "IsLatest"),
-            storage_class=findtext(element, "StorageClass"),
-            owner_id=owner_id,
-            owner_name=owner_name,
-            metadata=metadata,
+            findqualifiedtext(element, namespace + "Key"),
+            findqualifiedtext(element, namespace + "LastModified"),
+            etag,
+            size,
+            metadata,
+            findqualifiedtext(element, namespace + "VersionId"),
+            _intern(strings, is_latest),
+            _intern(strings, storage_class),
+            _intern(strings, owner_id),
+            _intern(strings, owner_name),
         )
 
 
+def _prefix_fromxml(element, bucket_name, _strings=None):
+    """Create new object with prefix from CommonPrefixes XML element."""
+    return Object(bucket_name, findtext(element, "Prefix"))
+
+
+_LIST_ENTRY_PARSERS = {
+    "Contents": Object.fromxml,
+    "Version": Object.fromxml,
+    "CommonPrefixes": _prefix_fromxml,
+    "DeleteMarker": Object.fromxml,
+}
+
+
 def parse_list_objects(response, bucket_name):
     """Parse ListObjects/ListObjectsV2/ListObjectVersions response."""
-    element = ET.fromstring(response.data.decode())
-    elements = findall(element, "Contents")
-    objects = [Object.fromxml(tag, bucket_name) for tag in elements]
-    marker = objects[-1].object_name if objects else None
-
-    elements = findall(element, "Version")
-    objects += [Object.fromxml(tag, bucket_name) for tag in elements]
-
-    elements = findall(element, "CommonPrefixes")
-    objects += [
-        Object(bucket_name, findtext(tag, "Prefix"))
-        for tag in elements
-    ]
-
-    elements = findall(element, "DeleteMarker")
-    objects += [Object.fromxml(tag, bucket_name) for tag in elements]
-
-    is_truncated = (findtext(element, "IsTruncated") or "").lower() == "true"
-    key_marker = findtext(element, "NextKeyMarker")
-    version_id_marker = findtext(element, "NextVersionIdMarker")
-    continuation_token = findtext(element, "NextContinuationToken")
+    entries = {name: [] for name in _LIST_ENTRY_PARSERS}
+    strings = {}
+    values = {}
+    events = ET.iterparse(
+        io.BytesIO(response.data), events=("start", "end"),
+    )
+    _, root = next(events)
+    depth = 1
+    for event, element in events:
+        if event == "start":
+            depth += 1
+            continue
+        depth -= 1
+        if depth != 1:
+            # Only direct children of root are list entries or markers.
+            continue
+        name = element.tag.rpartition("}")[2]
+        parse = _LIST_ENTRY_PARSERS.get(name)
+        if parse:
+            entries[name].append(parse(element, bucket_name, strings))
+            # Detach parsed entries so the tree does not grow with them.
+            root.remove(element)
+        elif name in _LIST_MARKERS:
+            values[name] = element.text
+
+    contents = entries["Contents"]
+    marker = contents[-1].object_name if contents else None
+    objects = (
+        contents + entries["Version"] + entries["CommonPrefixes"] +
+        entries["DeleteMarker"]
+    )
+
+    is_truncated = values.get("IsTruncated") in _TRUE_VALUES
+    key_marker = values.get("NextKeyMarker")
+    version_id_marker = values.get("NextVersionIdMarker")
+    continuation_token = values.get("NextContinuationToken")
     if key_marker is not None:
         continuation_token = key_marker
     if continuation_token is None:
-        continuation_token = findtext(element, "NextMarker")
+        continuation_token = values.get("NextMarker")
     if continuation_token is None and is_truncated:
         continuation_token = marker
     return objects, is_truncated, continuation_token, version_id_marker
@@ -239,8 +323,13 @@ def parse_list_objects(response, bucket_name):
 class CompleteMultipartUploadResult:
     """CompleteMultipartUpload API result."""
 
+    __slots__ = (
+        "_bucket_name", "_object_name", "_location", "_etag", "_version_id",
+        "_http_headers",
+    )
+
     def __init__(self, response):
-        element = ET.fromstring(response.data.decode())
+        element = ET.fromstring(response.data)
         self._bucket_name = findtext(element, "Bucket")
         self._object_name = findtext(element, "Key")
         self._location = findtext(element, "Location")
@@ -284,6 +373,8 @@ class CompleteMultipartUploadResult:
 class Part:
     """Part information of a multipart upload."""
 
+    __slots__ = ("_part_number", "_etag", "_last_modified", "_size")
+
     def __init__(self, part_number, etag, last_modified=None, size=None):
         self._part_number = part_number
         self._etag = etag
@@ -327,24 +418,20 @@ class Part:
 class ListPartsResult:
     """ListParts API result."""
 
+    __slots__ = (
+        "_bucket_name", "_object_name", "_initiator_id", "_initiator_name",
+        "_owner_id", "_owner_name", "_storage_class", "_part_number_marker",
+        "_next_part_number_marker", "_max_parts", "_is_truncated", "_parts",
+    )
+
     def __init__(self, response):
-        element = ET.fromstring(response.data.decode())
+        element = ET.fromstring(response.data)
         self._bucket_name = findtext(element, "Bucket")
         self._object_name = findtext(element, "Key")
-        tag = find(element, "Initiator")
-        self._initiator_id = (
-            None if tag is None else findtext(tag, "ID")
-        )
-        self._initiator_name = (
-            None if tag is None else findtext(tag, "DisplayName")
-        )
-        tag = find(element, "Owner")
-        self._owner_id = (
-            None if tag is None else findtext(tag, "ID")
-        )
-        self._owner_name = (
-            None if tag is None else findtext(tag, "DisplayName")
+        self._initiator_id, self._initiator_name = _get_id_and_name(
+            element, "Initiator",
         )
+        self._owner_id, self._owner_name = _get_id_and_name(element, "Owner")
         self._storage_class = findtext(element, "StorageClass")
         self._part_number_marker = findtext(element, "PartNumberMarker")
         self._next_part_number_marker = findtext(
@@ -355,10 +442,8 @@ class ListPartsResult:
         self._max_parts = findtext(element, "MaxParts")
         if self._max_parts:
             self._max_parts = int(self._max_parts)
-        self._is_truncated = findtext(element, "IsTruncated")
         self._is_truncated = (
-            self._is_truncated is not None and
-            self._is_truncated.lower() == "true"
+            findtext(element, "IsTruncated") in _TRUE_VALUES
         )
         self._parts = [Part.fromxml(tag) for tag in findall(element, "Part")]
 
@@ -426,23 +511,18 @@ class ListPartsResult:
 class Upload:
     """ Upload information of a multipart upload."""
 
+    __slots__ = (
+        "_object_name", "_upload_id", "_initiator_id", "_initiator_name",
+        "_owner_id", "_owner_name", "_storage_class", "_initiated_time",
+    )
+
     def __init__(self, element):
-        self._object_name = unquote(findtext(element, "Key", True))
+        self._object_name = _fast_unquote(findtext(element, "Key", True))
         self._upload_id = findtext(element, "UploadId")
-        tag = find(element, "Initiator")
-        self._initiator_id = (
-            None if tag is None else findtext(tag, "ID")
-        )
-        self._initiator_name = (
-            None if tag is None else findtext(tag, "DisplayName")
-        )
-        tag = find(element, "Owner")
-        self._owner_id = (
-            None if tag is None else findtext(tag, "ID")
-        )
-        self._owner_name = (
-            None if tag is None else findtext(tag, "DisplayName")
+        self._initiator_id, self._initiator_name = _get_id_and_name(
+            element, "Initiator",
         )
+        self._owner_id, self._owner_name = _get_id_and_name(element, "Owner")
         self._storage_class = findtext(element, "StorageClass")
         self._initiated_time = findtext(element, "Initiated")
         if self._initiated_time:
@@ -492,24 +572,25 @@ class Upload:
 class ListMultipartUploadsResult:
     """ListMultipartUploads API result."""
 
+    __slots__ = (
+        "_bucket_name", "_key_marker", "_upload_id_marker", "_next_key_marker",
+        "_next_upload_id_marker", "_max_uploads", "_is_truncated", "_uploads",
+    )
+
     def __init__(self, response):
-        element = ET.fromstring(response.data.decode())
+        element = ET.fromstring(response.data)
         self._bucket_name = findtext(element, "Bucket")
-        self._key_marker = findtext(element, "KeyMarker")
-        if self._key_marker:
-            self._key_marker = unquote(self._key_marker)
+        self._key_marker = _fast_unquote(findtext(element, "KeyMarker"))
         self._upload_id_marker = findtext(element, "UploadIdMarker")
-        self._next_key_marker = findtext(element, "NextKeyMarker")
-        if self._next_key_marker:
-            self._next_key_marker = unquote(self._next_key_marker)
+        self._next_key_marker = _fast_unquote(
+            findtext(element, "NextKeyMarker"),
+        )
         self._next_upload_id_marker = findtext(element, "NextUploadIdMarker")
         self._max_uploads = findtext(element, "MaxUploads")
         if self._max_uploads:
             self._max_uploads = int(self._max_uploads)
-        self._is_truncated = findtext(element, "IsTruncated")
         self._is_truncated = (
-            self._is_truncated is not None and
-            self._is_truncated.lower() == "true"
+            findtext(element, "IsTruncated") in _TRUE_VALUES
         )
         self._uploads = [Upload(tag) for tag in findall(element, "Upload")]
 
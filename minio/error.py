@@ -111,7 +111,7 @@ class S3Error(MinioException):
     @classmethod
     def fromxml(cls, response):
         """Create new object with values from XML element."""
-        element = ET.fromstring(response.data.decode())
+        element = ET.fromstring(response.data)
         return cls(
             findtext(element, "Code"),
             findtext(element, "Message"),
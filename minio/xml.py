@@ -37,34 +37,37 @@ def SubElement(parent, tag, text=None):  # pylint: disable=invalid-name
     return element
 
 
-def _get_namespace(element):
-    """Exact namespace if found."""
-    start = element.tag.find("{")
-    if start < 0:
-        return ""
-    start += 1
-    end = element.tag.find("}")
-    if end < 0:
-        return ""
-    return element.tag[start:end]
+def clarknamespace(element):
+    """
+    Get namespace of element in Clark notation i.e. '{namespace}', or empty
+    string if element has no namespace. Names prefixed with it are matched
+    by ElementTree directly without compiling a path expression.
+    """
+    return element.tag[:element.tag.find("}") + 1]
+
+
+def findqualifiedtext(element, name):
+    """
+    Get text of child element by name already qualified in Clark notation,
+    or None if not found. Like findtext(), an empty element gives None.
+    """
+    element = element.find(name)
+    return None if element is None else element.text
+
+
+def _qualify(element, name):
+    """Qualify name with namespace of element in Clark notation."""
+    return clarknamespace(element) + name
 
 
 def findall(element, name):
     """Namespace aware ElementTree.Element.findall()."""
-    namespace = _get_namespace(element)
-    return element.findall(
-        "ns:" + name if namespace else name,
-        {"ns": namespace} if namespace else {},
-    )
+    return element.findall(_qualify(element, name))
 
 
 def find(element, name):
     """Namespace aware ElementTree.Element.find()."""
-    namespace = _get_namespace(element)
-    return element.find(
-        "ns:" + name if namespace else name,
-        {"ns": namespace} if namespace else {},
-    )
+    return element.find(_qualify(element, name))
 
 
 def findtext(element, name, strict=False):
@@ -81,7 +84,7 @@ def findtext(element, name, strict=False):
 
 
 def unmarshal(cls, xmlstring):
-    """Unmarshal given XML string to an object of passed class."""
+    """Unmarshal given XML string or bytes to an object of passed class."""
     return cls.fromxml(ET.fromstring(xmlstring))
 
 
@@ -17,7 +17,6 @@
 from unittest import TestCase
 
 import mock
-from nose.tools import eq_, raises
 
 from minio import Minio
 from minio.api import _DEFAULT_USER_AGENT
@@ -27,23 +26,23 @@ from .minio_mocks import MockConnection, MockResponse
 
 
 class BucketExists(TestCase):
-    @raises(TypeError)
+    @classmethod
+    def setUpClass(cls):
+        cls.client = Minio('localhost:9000')
+
     def test_bucket_is_string(self):
-        client = Minio('localhost:9000')
-        client.bucket_exists(1234)
+        with self.assertRaises(TypeError):
+            self.client.bucket_exists(1234)
 
-    @raises(ValueError)
     def test_bucket_is_not_empty_string(self):
-        client = Minio('localhost:9000')
-        client.bucket_exists('  \t \n  ')
+        with self.assertRaises(ValueError):
+            self.client.bucket_exists('  \t \n  ')
 
-    @raises(ValueError)
     def test_bucket_exists_invalid_name(self):
-        client = Minio('localhost:9000')
-        client.bucket_exists('AB*CD')
+        with self.assertRaises(ValueError):
+            self.client.bucket_exists('AB*CD')
 
     @mock.patch('urllib3.PoolManager')
-    @raises(S3Error)
     def test_bucket_exists_bad_request(self, mock_connection):
         mock_server = MockConnection()
         mock_connection.return_value = mock_server
@@ -53,8 +52,10 @@ class BucketExists(TestCase):
                          {'User-Agent': _DEFAULT_USER_AGENT},
                          400)
         )
+        # Client must be created under the patch to use the mock server.
         client = Minio('localhost:9000')
-        client.bucket_exists('hello')
+        with self.assertRaises(S3Error):
+            client.bucket_exists('hello')
 
     @mock.patch('urllib3.PoolManager')
     def test_bucket_exists_works(self, mock_connection):
@@ -68,7 +69,7 @@ class BucketExists(TestCase):
         )
         client = Minio('localhost:9000')
         result = client.bucket_exists('hello')
-        eq_(True, result)
+        self.assertEqual(True, result)
         mock_server.mock_add_request(
             MockResponse('HEAD',
                          'https://localhost:9000/goodbye',
@@ -76,4 +77,4 @@ class BucketExists(TestCase):
                          404)
         )
         false_result = client.bucket_exists('goodbye')
-        eq_(False, false_result)
+        self.assertEqual(False, false_result)
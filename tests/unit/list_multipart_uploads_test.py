@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+# MinIO Python Library for Amazon S3 Compatible Cloud Storage,
+# (C) 2020 MinIO, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import TestCase
+
+from nose.tools import eq_
+
+from minio.datatypes import ListMultipartUploadsResult
+
+from .minio_mocks import MockResponse
+
+
+class ListMultipartUploadsTest(TestCase):
+    def test_list_multipart_uploads_result(self):
+        mock_data = '''<?xml version="1.0" encoding="UTF-8"?>
+<ListMultipartUploadsResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">
+  <Bucket>bucket</Bucket>
+  <KeyMarker>my%2Fdir%2Fstart</KeyMarker>
+  <UploadIdMarker></UploadIdMarker>
+  <NextKeyMarker>my-movie.m2ts</NextKeyMarker>
+  <NextUploadIdMarker>YW55IGlkZWEgd2h5</NextUploadIdMarker>
+  <MaxUploads>2</MaxUploads>
+  <IsTruncated>true</IsTruncated>
+  <Upload>
+    <Key>my%2Fdivisor</Key>
+    <UploadId>XMgbGlrZSBlbHZpbmcncyBub3QgaGF2aW5nIG11Y2ggbHVjaw</UploadId>
+    <Initiator>
+      <ID>arn:aws:iam::111122223333:user/user1-11111a31-17b5-4fb7-9df5</ID>
+      <DisplayName>user1</DisplayName>
+    </Initiator>
+    <Owner>
+      <ID>75aa57f09aa0c8caeab4f8c24e99d10f8e7faeebf76c078efc7c6caea54ba06a</ID>
+      <DisplayName>OwnerDisplayName</DisplayName>
+    </Owner>
+    <StorageClass>STANDARD</StorageClass>
+    <Initiated>2010-11-10T20:48:33.000Z</Initiated>
+  </Upload>
+  <Upload>
+    <Key>my-movie.m2ts</Key>
+    <UploadId>VXBsb2FkIElEIGZvcg</UploadId>
+    <Initiator>
+      <ID></ID>
+      <DisplayName/>
+    </Initiator>
+    <Owner>
+      <ID>minio</ID>
+      <DisplayName/>
+    </Owner>
+    <StorageClass>STANDARD</StorageClass>
+    <Initiated>2010-11-10T20:48:34.000Z</Initiated>
+  </Upload>
+</ListMultipartUploadsResult>'''
+        result = ListMultipartUploadsResult(
+            MockResponse(
+                "GET",
+                "https://localhost:9000/bucket?uploads=",
+                {},
+                200,
+                content=mock_data.encode(),
+            ),
+        )
+
+        eq_("bucket", result.bucket_name)
+        eq_("my/dir/start", result.key_marker)
+        eq_("my-movie.m2ts", result.next_key_marker)
+        eq_(2, result.max_uploads)
+        eq_(True, result.is_truncated)
+        eq_(2, len(result.uploads))
+        eq_("my/divisor", result.uploads[0].object_name)
+        eq_("user1", result.uploads[0].initator_name)
+        eq_("OwnerDisplayName", result.uploads[0].owner_name)
+        eq_("my-movie.m2ts", result.uploads[1].object_name)
+        eq_(None, result.uploads[1].initiator_id)
+        eq_(None, result.uploads[1].initator_name)
+        eq_("minio", result.uploads[1].owner_id)
+        eq_(None, result.uploads[1].owner_name)
@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from datetime import datetime
 from unittest import TestCase
 
 import mock
@@ -100,3 +101,157 @@ class ListObjectsTest(TestCase):
             objects.append(obj)
 
         eq_(2, len(objects))
+        # last_modified is parsed on first access; check repeat reads too.
+        eq_(datetime(2016, 11, 27, 7, 55, 53), objects[0].last_modified)
+        eq_(datetime(2016, 11, 27, 7, 55, 53), objects[0].last_modified)
+        eq_(datetime(2016, 11, 27, 7, 10, 27), objects[1].last_modified)
+
+    @mock.patch('urllib3.PoolManager')
+    def test_list_object_versions_works(self, mock_connection):
+        mock_data = '''<?xml version="1.0" encoding="UTF-8"?>
+<ListVersionsResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">
+  <Name>bucket</Name>
+  <Prefix></Prefix>
+  <KeyMarker></KeyMarker>
+  <VersionIdMarker></VersionIdMarker>
+  <MaxKeys>1000</MaxKeys>
+  <IsTruncated>false</IsTruncated>
+  <Version>
+    <Key>my-image.jpg</Key>
+    <VersionId>3/L4kqtJl40Nr8X8gdRQBpUMLUo</VersionId>
+    <IsLatest>false</IsLatest>
+    <LastModified>2009-10-12T17:50:30.000Z</LastModified>
+    <ETag>&quot;fba9dede5f27731c9771645a39863328&quot;</ETag>
+    <Size>434234</Size>
+    <StorageClass>STANDARD</StorageClass>
+  </Version>
+  <DeleteMarker>
+    <Key>my-image.jpg</Key>
+    <VersionId>03jpff543dhffds434rfdsFDN943fdsFkdmqnh892</VersionId>
+    <IsLatest>true</IsLatest>
+    <LastModified>2009-10-15T17:50:30.000Z</LastModified>
+  </DeleteMarker>
+  <Version>
+    <Key>my-second-image.jpg</Key>
+    <VersionId>QUpfdndhfd8438MNFDN93jdnJFkdmqnh893</VersionId>
+    <IsLatest>true</IsLatest>
+    <LastModified>2009-10-10T17:50:30.000Z</LastModified>
+    <ETag>&quot;9b2cf535f27731c974343645a3985328&quot;</ETag>
+    <Size>166434</Size>
+    <StorageClass>STANDARD</StorageClass>
+  </Version>
+</ListVersionsResult>'''
+        mock_server = MockConnection()
+        mock_connection.return_value = mock_server
+        mock_server.mock_add_request(
+            MockResponse(
+                "GET",
+                "https://localhost:9000/bucket?delimiter=&max-keys=1000"
+                "&prefix=&versions=",
+                {"User-Agent": _DEFAULT_USER_AGENT},
+                200,
+                content=mock_data.encode(),
+            ),
+        )
+        client = Minio('localhost:9000')
+        objects = list(
+            client.list_objects(
+                'bucket', recursive=True, include_version=True,
+            ),
+        )
+
+        eq_(3, len(objects))
+        eq_("my-second-image.jpg", objects[1].object_name)
+        eq_(166434, objects[1].size)
+        eq_(True, objects[2].is_delete_marker)
+
+    @mock.patch('urllib3.PoolManager')
+    def test_list_objects_empty_elements(self, mock_connection):
+        mock_data = '''<?xml version="1.0" encoding="UTF-8"?>
+<ListBucketResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">
+  <Name>bucket</Name>
+  <Prefix></Prefix>
+  <KeyCount>1</KeyCount>
+  <MaxKeys>1000</MaxKeys>
+  <IsTruncated>false</IsTruncated>
+  <Contents>
+    <Key>empty-fields</Key>
+    <LastModified/>
+    <ETag></ETag>
+    <Size></Size>
+    <VersionId/>
+    <Owner>
+      <ID>minio</ID>
+      <DisplayName/>
+    </Owner>
+    <StorageClass/>
+  </Contents>
+</ListBucketResult>'''
+        mock_server = MockConnection()
+        mock_connection.return_value = mock_server
+        mock_server.mock_add_request(
+            MockResponse(
+                "GET",
+                "https://localhost:9000/bucket?delimiter=&list-type=2"
+                "&max-keys=1000&prefix=",
+                {"User-Agent": _DEFAULT_USER_AGENT},
+                200,
+                content=mock_data.encode(),
+            ),
+        )
+        client = Minio('localhost:9000')
+        objects = list(client.list_objects('bucket', recursive=True))
+
+        eq_(1, len(objects))
+        eq_("empty-fields", objects[0].object_name)
+        eq_(None, objects[0].last_modified)
+        eq_(None, objects[0].etag)
+        eq_(None, objects[0].size)
+        eq_(None, objects[0].version_id)
+        eq_(None, objects[0].storage_class)
+        eq_("minio", objects[0].owner_id)
+        eq_(None, objects[0].owner_name)
+
+    @mock.patch('urllib3.PoolManager')
+    def test_list_objects_nested_entry_names(self, mock_connection):
+        mock_data = '''<?xml version="1.0" encoding="UTF-8"?>
+<ListBucketResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">
+  <Name>bucket</Name>
+  <Prefix></Prefix>
+  <KeyCount>1</KeyCount>
+  <MaxKeys>1000</MaxKeys>
+  <IsTruncated>false</IsTruncated>
+  <Contents>
+    <Key>nested</Key>
+    <LastModified>2016-11-27T07:55:53.000Z</LastModified>
+    <ETag>&quot;5d5512301b6b6e247b8aec334b2cf7ea&quot;</ETag>
+    <Size>493</Size>
+    <StorageClass>STANDARD</StorageClass>
+    <UserMetadata>
+      <Version>2</Version>
+      <NextMarker>zz</NextMarker>
+    </UserMetadata>
+  </Contents>
+</ListBucketResult>'''
+        mock_server = MockConnection()
+        mock_connection.return_value = mock_server
+        mock_server.mock_add_request(
+            MockResponse(
+                "GET",
+                "https://localhost:9000/bucket?delimiter=&list-type=2"
+                "&max-keys=1000&prefix=&user-metadata=true",
+                {"User-Agent": _DEFAULT_USER_AGENT},
+                200,
+                content=mock_data.encode(),
+            ),
+        )
+        client = Minio('localhost:9000')
+        objects = list(
+            client.list_objects(
+                'bucket', recursive=True, include_user_meta=True,
+            ),
+        )
+
+        eq_(1, len(objects))
+        eq_("nested", objects[0].object_name)
+        eq_({"Version": "2", "NextMarker": "zz"}, objects[0].metadata)
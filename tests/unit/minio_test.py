@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from datetime import datetime
 from unittest import TestCase
 from urllib.parse import urlunsplit
 
@@ -22,7 +23,7 @@ from nose.tools import eq_, raises
 from minio import Minio
 from minio import __version__ as minio_version
 from minio.api import _DEFAULT_USER_AGENT
-from minio.helpers import BaseURL, check_bucket_name
+from minio.helpers import BaseURL, check_bucket_name, strptime_rfc3339
 
 
 class ValidBucketName(TestCase):
@@ -171,3 +172,28 @@ class GetRegionTests(TestCase):
     @raises(ValueError)
     def test_invalid_value(self):
         BaseURL(None, None)
+
+
+class StrptimeRFC3339Tests(TestCase):
+    def test_fractional_seconds(self):
+        eq_(
+            strptime_rfc3339('2016-11-27T07:55:53.000Z'),
+            datetime(2016, 11, 27, 7, 55, 53),
+        )
+        eq_(
+            strptime_rfc3339('2016-11-27T07:55:53.12Z'),
+            datetime(2016, 11, 27, 7, 55, 53, 120000),
+        )
+
+    def test_whole_seconds(self):
+        eq_(
+            strptime_rfc3339('2016-11-27T07:55:53Z'),
+            datetime(2016, 11, 27, 7, 55, 53),
+        )
+
+    def test_none(self):
+        eq_(strptime_rfc3339(None), None)
+
+    @raises(ValueError)
+    def test_invalid_value(self):
+        strptime_rfc3339('2016-13-27T07:55:53.000Z')